@@ -1,12 +1,44 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+import pandas as pd
+import altair as alt
 import dsp
 import soundfile as sf
 import os
 
 st.set_page_config(page_title="DSP Audio Project", layout="wide")
 
+# --- Cached helpers ---
+# Streamlit re-executes this script on every interaction, so the expensive
+# loading/resampling is memoized across reruns (filter designs are cached inside dsp).
+
+@st.cache_data(show_spinner=False)
+def _load_channels(path1, mtime1, path2, mtime2):
+    """Loads and preps both files. mtimes are part of the cache key so edited files are reloaded."""
+    channels, fs = dsp.load_and_prep_data(path1, path2)
+    return tuple(channels), fs
+
+@st.cache_resource(show_spinner=False)
+def _gpu_stream():
+    """Persistent CUDA stream (None without a GPU); creating it also warms up the GPU once."""
+    return dsp.warm_up_gpu()
+
+def _decimate_for_plot(f, mag, target=2000):
+    """
+    Max-pools a spectrum down to ~target points (screens are ~1000 px wide anyway),
+    keeping peaks visible. Shipping/drawing ~400k points per chart would dominate rendering otherwise.
+    """
+    k = max(1, len(mag) // target)
+    n = k * (len(mag) // k)
+    return f[:n].reshape(-1, k).mean(axis=1), mag[:n].reshape(-1, k).max(axis=1)
+
+def _spectrum_frame(f, mag, freq_label="Freq (Hz)"):
+    """Spectrum as a DataFrame indexed by frequency, for Streamlit's native (browser-rendered) charts."""
+    return pd.DataFrame({"Magnitude": mag}, index=pd.Index(f, name=freq_label))
+
+# Warm up the GPU once at startup (cached across reruns) rather than on the first RUN click
+gpu_stream = _gpu_stream()
+
 st.title("DSP End-to-End Project: FDM & Filtering")
 st.markdown("""
 This application processes two stereo wav files (4 channels total), applies filters, 
@@ -55,7 +87,8 @@ if 'processed_data' not in st.session_state:
 if st.button("RUN DSP PIPELINE"):
     with st.spinner("Processing Audio... (Loading -> Filtering -> Upsampling -> Modulating -> Demodulating)"):
         # 1. Load
-        raw_channels, orig_fs = dsp.load_and_prep_data(file1, file2)
+        raw_channels, orig_fs = _load_channels(file1, os.path.getmtime(file1),
+                                               file2, os.path.getmtime(file2))
         
         # 2. Reorder per user selection (Indices are 0-based, options are 1-based)
         ordered_channels = [raw_channels[i-1] for i in selected_order]
@@ -64,11 +97,17 @@ if st.button("RUN DSP PIPELINE"):
         filtered, filt_desc = dsp.design_and_apply_filters(ordered_channels, orig_fs)
         
         # 4. Modulate
-        composite, carriers, mod_fs, upsampled_chans = dsp.modulation_process(filtered, orig_fs)
+        composite, carriers, mod_fs, upsampled_chans = dsp.modulation_process(filtered, orig_fs, gpu_stream)
         
         # 5. Demodulate
         recovered = dsp.demodulation_process(composite, carriers, mod_fs, orig_fs)
         
+        # 6. Spectra (computed once here so widget-only reruns do no FFT work),
+        # decimated to plot resolution
+        spectra_filtered = [_decimate_for_plot(*dsp.compute_spectrum(sig, orig_fs)) for sig in filtered]
+        spectrum_composite = _decimate_for_plot(*dsp.compute_spectrum(composite, mod_fs))
+        spectra_recovered = [_decimate_for_plot(*dsp.compute_spectrum(sig, orig_fs)) for sig in recovered]
+        
         # Store in session
         st.session_state['processed_data'] = {
             'channels': ordered_channels,  # Raw reordered
@@ -79,7 +118,10 @@ if st.button("RUN DSP PIPELINE"):
             'carriers': carriers,
             'orig_fs': orig_fs,
             'mod_fs': mod_fs,
-            'upsampled_chans': upsampled_chans # for checking pre-mod spectrum
+            'upsampled_chans': upsampled_chans, # for checking pre-mod spectrum
+            'spectra_filtered': spectra_filtered,
+            'spectrum_composite': spectrum_composite,
+            'spectra_recovered': spectra_recovered
         }
         st.success("Processing Complete!")
 
@@ -98,25 +140,20 @@ if st.session_state['processed_data']:
     # 1. Filtered Channels (Pre-Modulation)
     st.header("1. Filtered Channels - Frequency Domain")
     
-    fig1, axs1 = plt.subplots(2, 2, figsize=(12, 8))
-    axs1 = axs1.flatten()
+    # Charts ship the (decimated) data and are drawn by the browser, no server-side PNG rasterization
+    cols1 = st.columns(2) + st.columns(2)
     
     for i in range(4):
         # Use the upsampled version for plotting to match the freq axis scale of carriers conceptually, 
         # or just original. Original is better to see the filter effect in baseband.
-        f, mag = dsp.compute_spectrum(data['filtered'][i], fs)
-        axs1[i].plot(f, mag, color='tab:blue')
-        axs1[i].set_title(f"Channel {selected_order[i]} - {data['filt_desc'][i]}\n(Selected Slot {i+1})")
-        axs1[i].set_xlabel("Freq (Hz)")
-        axs1[i].set_ylabel("Magnitude")
-        axs1[i].grid(True, alpha=0.3)
-        
-        # Audio Player
-        col_a, col_b = st.columns([1, 4])
-        st.markdown(f"**Slot {i+1} Filtered Audio:**")
-        st.audio(data['filtered'][i], sample_rate=fs)
-        
-    st.pyplot(fig1)
+        f, mag = data['spectra_filtered'][i]
+        with cols1[i]:
+            st.markdown(f"**Channel {selected_order[i]} - {data['filt_desc'][i]}** (Selected Slot {i+1})")
+            st.line_chart(_spectrum_frame(f, mag), color='#1f77b4', height=250)
+            
+            # Audio Player
+            st.markdown(f"**Slot {i+1} Filtered Audio:**")
+            st.audio(data['filtered'][i], sample_rate=fs)
     
     st.divider()
     
@@ -124,20 +161,21 @@ if st.session_state['processed_data']:
     st.header("2. Composite Signal (FDM Output)")
     st.write(f"Modulation Fs: {mod_fs} Hz. Carriers: {data['carriers']} Hz")
     
-    fig2, ax2 = plt.subplots(figsize=(12, 4))
-    f_comp, mag_comp = dsp.compute_spectrum(data['composite'], mod_fs)
-    ax2.plot(f_comp, mag_comp, color='tab:red')
-    ax2.set_title("Composite Signal Spectrum")
-    ax2.set_xlabel("Frequency (Hz)")
-    ax2.set_ylabel("Magnitude")
-    ax2.grid(True)
+    f_comp, mag_comp = data['spectrum_composite']
+    spectrum = alt.Chart(_spectrum_frame(f_comp, mag_comp, "Frequency (Hz)").reset_index()).mark_line(color='#d62728').encode(
+        x='Frequency (Hz):Q', y='Magnitude:Q'
+    )
     
     # Annotate carriers
-    for c in data['carriers']:
-        ax2.axvline(x=c, color='k', linestyle='--', alpha=0.5)
-        ax2.text(c, max(mag_comp)*0.8, f"{c/1000}k", rotation=90)
-        
-    st.pyplot(fig2)
+    carrier_marks = pd.DataFrame({
+        'carrier': data['carriers'],
+        'label': [f"{c/1000}k" for c in data['carriers']],
+        'y': max(mag_comp)*0.8,
+    })
+    rules = alt.Chart(carrier_marks).mark_rule(color='black', strokeDash=[4, 4], opacity=0.5).encode(x='carrier:Q')
+    labels = alt.Chart(carrier_marks).mark_text(angle=270, align='left', dy=-6).encode(x='carrier:Q', y='y:Q', text='label:N')
+    
+    st.altair_chart((spectrum + rules + labels).properties(title="Composite Signal Spectrum", height=300))
     
     st.audio(data['composite'], sample_rate=mod_fs)
     # Save button
@@ -150,24 +188,20 @@ if st.session_state['processed_data']:
     # 3. Recovered Channels
     st.header("3. Recovered Channels (Demodulated)")
     
-    fig3, axs3 = plt.subplots(2, 2, figsize=(12, 8))
-    axs3 = axs3.flatten()
+    cols3 = st.columns(2) + st.columns(2)
     
     for i in range(4):
-        f, mag = dsp.compute_spectrum(data['recovered'][i], fs)
-        axs3[i].plot(f, mag, color='tab:green')
-        axs3[i].set_title(f"Recovered Ch {selected_order[i]} (from Carrier {data['carriers'][i]}Hz)")
-        axs3[i].set_xlabel("Freq (Hz)")
-        axs3[i].grid(True)
-        
-        st.markdown(f"**Slot {i+1} Recovered:**")
-        st.audio(data['recovered'][i], sample_rate=fs)
+        f, mag = data['spectra_recovered'][i]
+        with cols3[i]:
+            st.markdown(f"**Recovered Ch {selected_order[i]}** (from Carrier {data['carriers'][i]}Hz)")
+            st.line_chart(_spectrum_frame(f, mag), color='#2ca02c', height=250)
+            
+            st.markdown(f"**Slot {i+1} Recovered:**")
+            st.audio(data['recovered'][i], sample_rate=fs)
         
         # Save
         path_rec = f"outputs/recovered_ch_{selected_order[i]}.wav"
         sf.write(path_rec, data['recovered'][i], fs)
-
-    st.pyplot(fig3)
     
 else:
     st.info("Click 'RUN DSP PIPELINE' to start.")
@@ -1,27 +1,275 @@
 import numpy as np
 import scipy.signal as signal
+from scipy.fft import rfft, rfftfreq, next_fast_len, set_workers
 import soundfile as sf
 import collections
+import functools
+import math
+import os
+from math import gcd
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker threads for splitting a single long array across cores
+NUM_WORKERS = os.cpu_count() or 4
+
+# FDM transmission rate and carrier plan (AM-DSB-SC, one carrier per channel)
+FS_HIGH = 192000
+CARRIERS = (10000, 25000, 45000, 70000) # Separated bands
+
+# Default native processing rates: at least 44.1k so the 10k highpass fits, at most 48k
+# so channel 4 stays inside its carrier band and FS_HIGH remains an upsample
+NATIVE_FS_MIN, NATIVE_FS_MAX = 44100, 48000
+
+# Samples per block for block-wise filtering/modulation (fits in L2)
+BLOCK_SIZE = 1 << 16
+
+# Optional GPU backend (CuPy). Falls back to the NumPy/SciPy path when CuPy is
+# missing or no CUDA device is usable.
+try:
+    import cupy as cp
+    from cupyx.scipy import signal as csignal
+    USE_GPU = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    cp = None
+    csignal = None
+    USE_GPU = False
+
+# Optional JIT backend (Numba) for the fused modulation/demodulation kernels
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Optional fused elementwise evaluation (numexpr) for the NumPy carrier multiplies
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
 
 # Channel container
 Channel = collections.namedtuple('Channel', ['data', 'name', 'original_fs'])
 
-def load_and_prep_data(file1_path, file2_path, target_fs=44100):
+# Designed input filters: Butterworth SOS matrices, their FIR equivalents, and descriptions
+FilterBank = collections.namedtuple('FilterBank', ['sos', 'fir', 'specs'])
+
+def _resample_ratio(fs_in, fs_out):
+    """Reduced (up, down) integer factors for resample_poly, e.g. 44100 -> 192000 is 640/147."""
+    g = gcd(int(fs_in), int(fs_out))
+    return int(fs_out) // g, int(fs_in) // g
+
+def _sosfilt_into(sos, x, out, blocksize=BLOCK_SIZE):
+    """
+    sosfilt(sos, x) written into the preallocated `out` (may be x itself).
+    Filters block by block carrying the filter state, so temporaries are block-sized
+    instead of a full-length copy per call.
+    """
+    zi = np.zeros((sos.shape[0], 2), dtype=out.dtype)
+    for start in range(0, len(x), blocksize):
+        stop = start + blocksize
+        out[start:stop], zi = signal.sosfilt(sos, x[start:stop], zi=zi)
+    return out
+
+def _carrier_period(fc, fs, xp=np):
+    """
+    One exact period of float32 cos(2*pi*fc*n/fs). The phase fc*n/fs repeats every
+    fs/gcd(fc, fs) samples for any integer fc and fs (96 for 10 kHz at 192 kHz, 64 for 45 kHz),
+    so the carriers never need to be evaluated over the full signal length.
+    `xp` is the array module (numpy or cupy).
+    """
+    period = int(fs) // gcd(int(fc), int(fs))
+    phase = (xp.arange(period) * int(fc)) % int(fs)
+    return xp.cos((2 * np.pi / fs) * phase.astype(xp.float32))
+
+def _carrier_wave(fc, fs, num_samples, xp=np):
+    """float32 cos(2*pi*fc*n/fs) over num_samples, tiled from one exact period."""
+    lut = _carrier_period(fc, fs, xp)
+    return xp.tile(lut, -(-num_samples // len(lut)))[:num_samples]
+
+def _multiply_carrier(x, fc, fs, out, scale=1.0, n0=0, accumulate=False):
+    """
+    out = scale * x * cos(2*pi*fc*(n0+n)/fs) (or out += ... with accumulate=True) without
+    building an N-length carrier: contiguous x is viewed as rows of one carrier period and
+    the short LUT is broadcast across them (strided x or out fall back to a tiled carrier).
+    `n0` is the sample offset of x, so a long signal can be processed block by block.
+    With numexpr available the multiply (and add) run as one fused, multi-threaded pass.
+    """
+    lut = _carrier_period(fc, fs) * np.float32(scale)
+    p = len(lut)
+    lut = np.roll(lut, -(n0 % p))
+    if x.flags.c_contiguous and out.flags.c_contiguous:
+        body = len(x) - len(x) % p
+        parts = [
+            (x[:body].reshape(-1, p), out[:body].reshape(-1, p), lut),
+            (x[body:], out[body:], lut[:len(x) - body]),
+        ]
+    else:
+        # Strided input: reshape would copy (and write into the copy), so tile the LUT instead
+        parts = [(x, out, np.tile(lut, -(-len(x) // p))[:len(x)])]
+    for xs, outs, luts in parts:
+        if ne is not None:
+            expr = "outs + xs * luts" if accumulate else "xs * luts"
+            ne.evaluate(expr, local_dict={'xs': xs, 'luts': luts, 'outs': outs}, out=outs)
+        elif accumulate:
+            outs += xs * luts
+        else:
+            np.multiply(xs, luts, out=outs)
+    return out
+
+def _modulate_gpu(filtered_channels, up, down, carriers, fs_high, stream=None):
+    """
+    GPU version of the upsample + modulate stage.
+    Returns (composite, stacked upsampled channels) as host arrays.
+    """
+    if stream is None:
+        stream = cp.cuda.get_current_stream()
+    with stream:
+        chans = cp.stack([
+            csignal.resample_poly(cp.asarray(sig), up, down, window=('kaiser', 8.6)) for sig in filtered_channels
+        ]).astype(cp.float32)
+        carriers_mat = cp.stack([_carrier_wave(fc, fs_high, chans.shape[1], xp=cp) for fc in carriers])
+        composite = (chans * carriers_mat).sum(axis=0)
+        return cp.asnumpy(composite, stream=stream), cp.asnumpy(chans, stream=stream)
+
+if HAVE_NUMBA:
+    # Carriers inside the kernels use the Chebyshev recurrence
+    #   cos(w*(n+1)) = 2*cos(w)*cos(w*n) - cos(w*(n-1))
+    # i.e. one multiply-add per sample instead of a cos() call. State is kept in float64,
+    # so the drift over a few million samples stays far below float32 resolution.
+
+    @njit(nogil=True, fastmath=True, cache=True)
+    def _modulate_kernel(chans, fcs, fs_high, n0, out):
+        """
+        out[n] = sum_k chans[k, n] * cos(2*pi*fc_k*(n0+n)/fs_high), carriers generated inline, no intermediates.
+        `n0` is the sample offset of this block, so blocks can be processed independently.
+        """
+        num_ch, num_samples = chans.shape
+        two_cos_w = np.empty(num_ch)
+        c_cur = np.empty(num_ch)
+        c_prev = np.empty(num_ch)
+        for k in range(num_ch):
+            w = 2.0 * math.pi * fcs[k] / fs_high
+            two_cos_w[k] = 2.0 * math.cos(w)
+            # Seed at the block offset (float64 phase, no integer reduction needed)
+            c_cur[k] = math.cos(w * n0)
+            c_prev[k] = math.cos(w * (n0 - 1))
+        for n in range(num_samples):
+            acc = 0.0
+            for k in range(num_ch):
+                acc += chans[k, n] * c_cur[k]
+                c_next = two_cos_w[k] * c_cur[k] - c_prev[k]
+                c_prev[k] = c_cur[k]
+                c_cur[k] = c_next
+            out[n] = acc
+
+    @njit(nogil=True, cache=True)
+    def _mix_decimate_kernel(x, fc, fs, sos, q, out):
+        """
+        out = sosfilt(sos, 2*x*cos(2*pi*fc*n/fs))[::q] in a single pass:
+        mixing, the anti-alias biquad cascade and decimation without the intermediate arrays.
+        """
+        n_sections = sos.shape[0]
+        zi = np.zeros((n_sections, 2))
+        w = 2.0 * math.pi * fc / fs
+        two_cos_w = 2.0 * math.cos(w)
+        c_cur = 1.0
+        c_prev = math.cos(w)  # cos(-w)
+        for n in range(x.shape[0]):
+            v = 2.0 * x[n] * c_cur
+            c_next = two_cos_w * c_cur - c_prev
+            c_prev = c_cur
+            c_cur = c_next
+            # Transposed direct form II per section, same recurrence as scipy's sosfilt
+            for s in range(n_sections):
+                y = sos[s, 0] * v + zi[s, 0]
+                zi[s, 0] = sos[s, 1] * v - sos[s, 4] * y + zi[s, 1]
+                zi[s, 1] = sos[s, 2] * v - sos[s, 5] * y
+                v = y
+            if n % q == 0:
+                out[n // q] = v
+
+    @njit(nogil=True, cache=True)
+    def _normalize_kernel(flat):
+        """In-place unit-peak scaling of a 1-D array: one peak pass, then one scaling pass, no temporaries."""
+        peak = 0.0
+        for i in range(flat.size):
+            av = abs(flat[i])
+            if av > peak:
+                peak = av
+        if peak > 0:
+            inv = 1.0 / peak
+            for i in range(flat.size):
+                flat[i] *= inv
+
+def _normalize(x):
+    """
+    Scales x in place to a peak of 1 (silence is left as is) and returns it.
+    The peak is found once and applied as a multiply by 1/peak.
+    """
+    if HAVE_NUMBA and x.flags.c_contiguous:
+        _normalize_kernel(x.reshape(-1))
+        return x
+    # max/-min instead of np.abs(x).max() avoids a full-size temporary
+    peak = max(float(x.max()), -float(x.min()))
+    if peak > 0:
+        x *= 1.0 / peak
+    return x
+
+def warm_up_gpu():
+    """
+    Creates the CUDA context and compiles the modulation kernels on a tiny input,
+    so the first real run doesn't pay for it. Both default native rates are warmed up,
+    since each gives a different upsampling ratio. Returns a persistent stream, or None without a GPU.
+    """
+    if not USE_GPU:
+        return None
+    stream = cp.cuda.Stream(non_blocking=True)
+    dummy = [np.zeros(1024, dtype=np.float32)] * len(CARRIERS)
+    for fs in (NATIVE_FS_MIN, NATIVE_FS_MAX):
+        _modulate_gpu(dummy, *_resample_ratio(fs, FS_HIGH), CARRIERS, FS_HIGH, stream)
+    stream.synchronize()
+    return stream
+
+def _read_stereo(path, num_frames):
+    """
+    Reads the first num_frames of a wav file as float32 (num_frames, 2).
+    Mono files are duplicated into both columns.
+    """
+    y, _ = sf.read(path, frames=num_frames, dtype='float32', always_2d=True)
+    if y.shape[1] == 1:
+        return np.repeat(y, 2, axis=1)
+    return np.ascontiguousarray(y[:, :2])
+
+def load_and_prep_data(file1_path, file2_path, target_fs=None):
     """
     Loads two stereo wav files, resamples them to target_fs, 
     trims to min length, and separates into 4 channels.
+    By default target_fs is the higher native rate (at least 44.1k, so the 10k highpass fits,
+    and at most 48k, so channel 4 stays inside its carrier band and fs_high remains an upsample),
+    so matching inputs are not resampled here at all: modulation goes native -> fs_high in one step.
     """
-    # Load files
-    y1, fs1 = sf.read(file1_path)
-    y2, fs2 = sf.read(file2_path)
+    info1 = sf.info(file1_path)
+    info2 = sf.info(file2_path)
+    fs1, fs2 = info1.samplerate, info2.samplerate
     
-    # Resample if needed
+    if target_fs is None:
+        target_fs = min(max(fs1, fs2, NATIVE_FS_MIN), NATIVE_FS_MAX)
+    
+    # When neither file needs resampling, trim before reading so the tail
+    # of the longer file is never loaded
+    frames1, frames2 = info1.frames, info2.frames
+    if fs1 == target_fs and fs2 == target_fs:
+        frames1 = frames2 = min(frames1, frames2)
+    
+    # Load files (float32 end-to-end: sources are 16-bit and playback is float32 anyway)
+    y1 = _read_stereo(file1_path, frames1)
+    y2 = _read_stereo(file2_path, frames2)
+    
+    # Resample if needed (polyphase, both channels at once)
     if fs1 != target_fs:
-        num_samples = int(len(y1) * target_fs / fs1)
-        y1 = signal.resample(y1, num_samples)
+        y1 = signal.resample_poly(y1, *_resample_ratio(fs1, target_fs), axis=0).astype(np.float32, copy=False)
     if fs2 != target_fs:
-        num_samples = int(len(y2) * target_fs / fs2)
-        y2 = signal.resample(y2, num_samples)
+        y2 = signal.resample_poly(y2, *_resample_ratio(fs2, target_fs), axis=0).astype(np.float32, copy=False)
         
     # Trim to match lengths
     min_len = min(len(y1), len(y2))
@@ -29,8 +277,8 @@ def load_and_prep_data(file1_path, file2_path, target_fs=44100):
     y2 = y2[:min_len]
     
     # Normalize inputs standardly to avoid initial massive volume differences
-    y1 = y1 / np.max(np.abs(y1)) if np.max(np.abs(y1)) > 0 else y1
-    y2 = y2 / np.max(np.abs(y2)) if np.max(np.abs(y2)) > 0 else y2
+    y1 = _normalize(y1)
+    y2 = _normalize(y2)
     
     # Split into 4 channels
     # Ch1: File1 L, Ch2: File1 R, Ch3: File2 L, Ch4: File2 R
@@ -43,57 +291,87 @@ def load_and_prep_data(file1_path, file2_path, target_fs=44100):
     
     return channels, target_fs
 
-def design_and_apply_filters(channels, fs):
+def _fir_from_sos(sos, fs, numtaps=501):
+    """Linear-phase FIR (odd length, so highpass is allowed) matching the magnitude response of an SOS filter."""
+    freqs = np.linspace(0, fs / 2, 1025)
+    _, h = signal.sosfreqz(sos, worN=freqs, fs=fs)
+    return signal.firwin2(numtaps, freqs, np.abs(h), fs=fs).astype(np.float32)
+
+@functools.lru_cache(maxsize=8)
+def design_filters(fs):
     """
-    Applies 4 different stable IIR filters (Butterworth).
-    Returns filtered channels and filter descriptions.
+    Designs 4 different stable IIR filters (Butterworth, SOS form), plus a 501-tap FIR
+    matching each magnitude response for FFT convolution.
+    SOS matrices are float32 so sosfilt runs in single precision on float32 audio.
+    Cached per fs, so every caller shares one design. Returns a FilterBank.
     """
-    filtered_channels = []
-    filter_specs = []
-    
     # Nyquist
     nyq = 0.5 * fs
     
-    # Filter 1: Lowpass < 2000 Hz (Bass/Speech fund.)
-    sos1 = signal.butter(4, 2000 / nyq, btype='low', output='sos')
-    filt1 = signal.sosfilt(sos1, channels[0])
-    filtered_channels.append(filt1)
-    filter_specs.append("Lowpass (fc=2kHz): Isolates low freq components")
-
-    # Filter 2: Bandpass 2000-5000 Hz (Mid-range/Vocals)
-    sos2 = signal.butter(4, [2000 / nyq, 5000 / nyq], btype='band', output='sos')
-    filt2 = signal.sosfilt(sos2, channels[1])
-    filtered_channels.append(filt2)
-    filter_specs.append("Bandpass (2-5kHz): Captures vocal/mid range")
-
-    # Filter 3: Bandpass 5000-10000 Hz (Presence/High-mids)
-    sos3 = signal.butter(4, [5000 / nyq, 10000 / nyq], btype='band', output='sos')
-    filt3 = signal.sosfilt(sos3, channels[2])
-    filtered_channels.append(filt3)
-    filter_specs.append("Bandpass (5-10kHz): High-mid presence")
+    sos_list = [
+        # Filter 1: Lowpass < 2000 Hz (Bass/Speech fund.)
+        signal.butter(4, 2000 / nyq, btype='low', output='sos'),
+        # Filter 2: Bandpass 2000-5000 Hz (Mid-range/Vocals)
+        signal.butter(4, [2000 / nyq, 5000 / nyq], btype='band', output='sos'),
+        # Filter 3: Bandpass 5000-10000 Hz (Presence/High-mids)
+        signal.butter(4, [5000 / nyq, 10000 / nyq], btype='band', output='sos'),
+        # Filter 4: Highpass > 10000 Hz (Brilliance/Air)
+        signal.butter(4, 10000 / nyq, btype='high', output='sos'),
+    ]
+    sos_list = [sos.astype(np.float32) for sos in sos_list]
+    filter_specs = [
+        "Lowpass (fc=2kHz): Isolates low freq components",
+        "Bandpass (2-5kHz): Captures vocal/mid range",
+        "Bandpass (5-10kHz): High-mid presence",
+        "Highpass (fc=10kHz): High frequency detail",
+    ]
+    fir_list = [_fir_from_sos(sos, fs) for sos in sos_list]
+    
+    return FilterBank(tuple(sos_list), tuple(fir_list), tuple(filter_specs))
 
-    # Filter 4: Highpass > 10000 Hz (Brilliance/Air)
-    sos4 = signal.butter(4, 10000 / nyq, btype='high', output='sos')
-    filt4 = signal.sosfilt(sos4, channels[3])
-    filtered_channels.append(filt4)
-    filter_specs.append("Highpass (fc=10kHz): High frequency detail")
+def design_and_apply_filters(channels, fs, filters=None, method='fir'):
+    """
+    Applies 4 different stable filters (Butterworth responses).
+    `filters` is an optional FilterBank from design_filters(fs),
+    so callers can design once and reuse it across runs.
+    method='fir': FIR equivalents via overlap-add FFT convolution (zero-phase, parallel FFTs).
+      The gain is from multi-core FFTs; on a single core it is slightly slower than 'iir'.
+    method='iir': the Butterworth SOS cascades with sosfilt (causal, block-wise, for streaming use).
+    Returns filtered channels and filter descriptions.
+    """
+    if filters is None:
+        filters = design_filters(fs)
     
-    return filtered_channels, filter_specs
+    filt_buf = np.empty((len(channels), len(channels[0])), dtype=np.float32)
+    if method == 'fir':
+        # oaconvolve runs on pocketfft rFFTs; let them use all cores
+        with set_workers(-1):
+            for row, fir, ch in zip(filt_buf, filters.fir, channels):
+                row[:] = signal.oaconvolve(ch, fir, mode='same')
+    elif method == 'iir':
+        # Channels are independent and sosfilt releases the GIL, so filter them concurrently
+        # straight into one preallocated (4, N) buffer
+        with ThreadPoolExecutor(max_workers=len(channels)) as ex:
+            list(ex.map(_sosfilt_into, filters.sos, channels, filt_buf))
+    else:
+        raise ValueError(f"Unknown filter method {method!r}, expected 'fir' or 'iir'")
+    filtered_channels = list(filt_buf)
+    
+    return filtered_channels, list(filters.specs)
 
 def compute_spectrum(signal_data, fs):
     """Computes single-sided magnitude spectrum."""
     n = len(signal_data)
-    fft_data = np.fft.fft(signal_data)
-    freqs = np.fft.fftfreq(n, d=1/fs)
-    
-    # Take positive half
-    half_n = n // 2
-    mag = np.abs(fft_data[:half_n]) / n # Normalize
-    f = freqs[:half_n]
+    # Real-input FFT only computes the n//2+1 non-negative bins; zero-pad to a fast composite length
+    m = next_fast_len(n, real=True)
+    fft_data = rfft(signal_data, n=m, workers=-1)
+    f = rfftfreq(m, d=1/fs)
+    mag = np.abs(fft_data)
+    mag *= 1.0 / n # Normalize in place
     
     return f, mag
 
-def modulation_process(filtered_channels, fs):
+def modulation_process(filtered_channels, fs, gpu_stream=None):
     """
     Modulates each channel onto a carrier.
     Carrier spacing must accommodate the channel bandwidth.
@@ -141,56 +419,80 @@ def modulation_process(filtered_channels, fs):
        Ch4 (Effective BW ~10k) -> fc=60k (Band 50-70k)
     3. Sum.
     4. Demodulate: Bandpass at target, Mult by fc, Lowpass.
-    5. Downsample back to 44.1kHz for playback.
+    5. Downsample back to the original (native) rate, 44.1-48kHz, for playback.
     """
     
     # Upsample configuration
-    fs_high = 192000
-    carriers = [10000, 25000, 45000, 70000] # Separated bands
-    
-    modulated_signals = []
+    fs_high = FS_HIGH
+    carriers = list(CARRIERS)
     
     # We need to upsample first
-    upsampled_channels = []
-    for sig in filtered_channels:
-        num_resampled = int(len(sig) * fs_high / fs)
-        # Using simple resample (FFT based) or linear. FFT based is fine for offline.
-        sig_up = signal.resample(sig, num_resampled)
-        upsampled_channels.append(sig_up)
+    # Polyphase FIR resampling: stays in the time domain instead of a full-length FFT/IFFT per channel
+    up, down = _resample_ratio(fs, fs_high)
     
-    t = np.arange(len(upsampled_channels[0])) / fs_high
-    
-    for i, sig_up in enumerate(upsampled_channels):
-        fc = carriers[i]
-        mod = sig_up * np.cos(2 * np.pi * fc * t)
-        modulated_signals.append(mod)
+    if USE_GPU:
+        # `gpu_stream` is the persistent stream from warm_up_gpu(), if the caller kept one
+        composite, chans = _modulate_gpu(filtered_channels, up, down, carriers, fs_high, gpu_stream)
+    else:
+        # Stack all channels into one (4, N) array so modulation is a single vectorized pass.
+        # The 4 upsamples are independent and run concurrently (resample_poly releases the GIL).
+        # Each upsample is written straight into its row of a preallocated (4, N) float32 array.
+        n_up = -(-len(filtered_channels[0]) * up // down)
+        chans = np.empty((len(filtered_channels), n_up), dtype=np.float32)
+        def upsample_into(sig, row):
+            row[:] = signal.resample_poly(sig, up, down, window=('kaiser', 8.6))
+        with ThreadPoolExecutor(max_workers=len(filtered_channels)) as ex:
+            list(ex.map(upsample_into, filtered_channels, chans))
         
-    composite = np.sum(modulated_signals, axis=0)
+        if HAVE_NUMBA:
+            # Fused JIT kernel: carriers generated inline, no (4, N) carrier matrix
+            composite = np.empty(chans.shape[1], dtype=np.float32)
+            fcs = np.asarray(carriers, dtype=np.int64)
+            # Split into sample blocks on the thread pool (the kernel releases the GIL) rather than
+            # numba's parallel=True, whose threading layer hangs when called from Streamlit's script thread
+            bounds = np.linspace(0, len(composite), NUM_WORKERS + 1).astype(int)
+            with ThreadPoolExecutor(max_workers=NUM_WORKERS) as ex:
+                list(ex.map(
+                    lambda a, b: _modulate_kernel(chans[:, a:b], fcs, fs_high, a, composite[a:b]), bounds[:-1], bounds[1:]
+                ))
+        else:
+            # Accumulate block by block against one-period carrier LUTs (no (4, N) carrier matrix),
+            # so each composite block stays in cache while all 4 channels are added into it
+            composite = np.zeros(chans.shape[1], dtype=np.float32)
+            for start in range(0, len(composite), BLOCK_SIZE):
+                stop = min(start + BLOCK_SIZE, len(composite))
+                for sig_up, fc in zip(chans, carriers):
+                    _multiply_carrier(sig_up[start:stop], fc, fs_high, composite[start:stop], n0=start, accumulate=True)
     
     # Normalize composite to prevent clipping
-    composite = composite / np.max(np.abs(composite))
+    composite = _normalize(composite)
+    
+    # Rows of `chans` are views, no per-channel copies
+    upsampled_channels = list(chans)
     
     return composite, carriers, fs_high, upsampled_channels
 
-def demodulation_process(composite, carriers, fs_high, original_fs):
+@functools.lru_cache(maxsize=8)
+def _design_demod_filters(fs_high, carriers, q):
     """
-    Recovers the signals.
-    1. Bandpass around Carrier.
-    2. Sync Demod (Mult by carrier).
-    3. Lowpass filter to remove 2*fc component.
-    4. Downsample.
+    Per-carrier bandpass (at fs_high) and lowpass (at fs_high/q) SOS matrices, plus the
+    decimation anti-alias filter. Cached on (fs_high, carriers, q); carriers must be a tuple.
     """
-    recovered_channels = []
-    t = np.arange(len(composite)) / fs_high
     nyq = 0.5 * fs_high
+    nyq_mid = 0.5 * (fs_high // q)
     
     # Estimated Bandwidths for filter design (approximate generous masks)
     # Ch1 (orig ~2k) -> at fc=10k, band is 8-12k. BW=4k.
     # We used specific carriers, let's design BPFs around them +/- bandwidth
     bw_estimates = [4000, 6000, 10000, 15000] # Half-widths roughly
     
+    # LPF cutoff should be roughly the original bandwidth of that channel
+    # Ch1: 2k, Ch2: 5k, Ch3: 10k, Ch4: 12k
+    lpf_cutoffs = [2500, 5500, 10500, 15000] 
+    
+    sos_bp_list = []
+    sos_lp_list = []
     for i, fc in enumerate(carriers):
-        # 1. Bandpass Isolation
         # Determine passband
         bw = bw_estimates[i]
         low = fc - bw
@@ -198,26 +500,62 @@ def demodulation_process(composite, carriers, fs_high, original_fs):
         if low < 100: low = 100
         if high > nyq - 100: high = nyq - 100
         
-        sos_bp = signal.butter(4, [low/nyq, high/nyq], btype='band', output='sos')
-        isolated = signal.sosfilt(sos_bp, composite)
+        sos_bp_list.append(signal.butter(4, [low/nyq, high/nyq], btype='band', output='sos').astype(np.float32))
+        sos_lp_list.append(signal.butter(4, lpf_cutoffs[i]/nyq_mid, btype='low', output='sos').astype(np.float32))
+    
+    # Same anti-alias filter signal.decimate designs, for the fused Numba path
+    sos_aa = signal.cheby1(8, 0.05, 0.8 / q, output='sos')
+    
+    return tuple(sos_bp_list), tuple(sos_lp_list), sos_aa
+
+def demodulation_process(composite, carriers, fs_high, original_fs):
+    """
+    Recovers the signals.
+    1. Bandpass around Carrier.
+    2. Sync Demod (Mult by carrier).
+    3. Decimate by 4 early, then lowpass filter to remove 2*fc component.
+    4. Downsample.
+    """
+    composite = np.asarray(composite, dtype=np.float32)
+    
+    # Decimate right after mixing so the LPF runs at fs_high/4 (48k) instead of fs_high.
+    # decimate()'s own anti-alias filter (8th order Chebyshev at 0.8*fs_mid/2 = 19.2k) 
+    # suppresses the 2*fc images that would otherwise fold into the channel band.
+    q = 4
+    fs_mid = fs_high // q
+    up, down = _resample_ratio(fs_mid, original_fs)
+    sos_bp_list, sos_lp_list, sos_aa = _design_demod_filters(fs_high, tuple(carriers), q)
+    
+    # Preallocated work buffers, one row per chain since the chains run concurrently
+    isolated_buf = np.empty((len(carriers), len(composite)), dtype=np.float32)
+    # Decimated rows are only needed by the JIT path; the SciPy fallback gets them from signal.decimate
+    mid_buf = np.empty((len(carriers), -(-len(composite) // q)), dtype=np.float32) if HAVE_NUMBA else None
+    
+    def demod_channel(i):
+        fc = carriers[i]
         
-        # 2. Downconversion
-        demod = isolated * np.cos(2 * np.pi * fc * t) * 2 # *2 to recover amplitude
+        # 1. Bandpass Isolation
+        isolated = _sosfilt_into(sos_bp_list[i], composite, isolated_buf[i])
         
-        # 3. LPF to remove double freq term and get baseband
-        # Cutoff should be roughly the original bandwidth of that channel
-        # Ch1: 2k, Ch2: 5k, Ch3: 10k, Ch4: 12k
-        lpf_cutoffs = [2500, 5500, 10500, 15000] 
-        sos_lp = signal.butter(4, lpf_cutoffs[i]/nyq, btype='low', output='sos')
-        baseband = signal.sosfilt(sos_lp, demod)
+        # 2. Downconversion + 3. Decimate, then LPF to remove double freq term and get baseband
+        if HAVE_NUMBA:
+            demod_mid = mid_buf[i]
+            _mix_decimate_kernel(isolated, fc, fs_high, sos_aa, q, demod_mid)
+        else:
+            # Mixed in place over the isolated band
+            demod = _multiply_carrier(isolated, fc, fs_high, isolated, scale=2) # *2 to recover amplitude
+            demod_mid = signal.decimate(demod, q, ftype='iir', zero_phase=False)
+        baseband = _sosfilt_into(sos_lp_list[i], demod_mid, demod_mid)
         
         # 4. Downsample
-        num_original = int(len(baseband) * original_fs / fs_high)
-        recovered = signal.resample(baseband, num_original)
+        recovered = signal.resample_poly(baseband, up, down).astype(np.float32, copy=False)
         
         # Normalize
-        rec_norm = recovered / np.max(np.abs(recovered))
-        recovered_channels.append(rec_norm)
+        return _normalize(recovered)
+    
+    # Each channel's chain only reads the shared composite, so the 4 chains run in parallel
+    with ThreadPoolExecutor(max_workers=len(carriers)) as ex:
+        recovered_channels = list(ex.map(demod_channel, range(len(carriers))))
         
     return recovered_channels
 